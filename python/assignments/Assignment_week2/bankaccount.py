@@ -1,4 +1,6 @@
 class bankaccount:
+    __slots__ = ('account_holder', 'balance', 'account_type')
+
     def __init__(self, account_holder, balance, account_type):
         self.account_holder = account_holder
         self.balance = balance
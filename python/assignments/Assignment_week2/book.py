@@ -1,13 +1,16 @@
 from datetime import datetime
 
+_CURRENT_YEAR = datetime.now().year
+
 class book:
+    __slots__ = ('title', 'author', 'publication_year')
+
     def __init__(self, title, author, publication_year):
         self.title = title
         self.author = author
         self.publication_year = publication_year
     def get_age(self):
-        current_year = datetime.now().year
-        return current_year - self.publication_year
+        return _CURRENT_YEAR - self.publication_year
 
 book1 = book("Python Programming", "John Doe", 2020)
 print("Book age:", book1.get_age())
\ No newline at end of file
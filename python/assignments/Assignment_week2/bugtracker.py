@@ -1,18 +1,37 @@
 class bugtracker:
     def __init__(self):
-        self.bugs = {}
+        self.ids = []
+        self.desc = []
+        self.sev = []
+        self.status = []
+        self._index = {}
     def add_bug(self, bug_id, description, severity):
-        self.bugs[bug_id] = {
-            "description": description,
-            "severity": severity,
-            "status": "open"
-        }
+        # Re-adding an existing id overwrites its row, like the old dict entry did
+        if bug_id in self._index:
+            row = self._index[bug_id]
+            self.desc[row] = description
+            self.sev[row] = severity
+            self.status[row] = "open"
+            return
+        self._index[bug_id] = len(self.ids)
+        self.ids.append(bug_id)
+        self.desc.append(description)
+        self.sev.append(severity)
+        self.status.append("open")
     def update_status(self, bug_id, new_status):
-        self.bugs[bug_id]["status"] = new_status
+        self.status[self._index[bug_id]] = new_status
+    def as_dataframe(self):
+        import pandas as pd
+        return pd.DataFrame({
+            "bug_id": self.ids,
+            "description": self.desc,
+            "severity": self.sev,
+            "status": self.status
+        })
 
     # def list_all_bugs(self):
-    #     for bug_id in self.bugs.items():
-    #         print(f"Bug ID: {bug_id}, Description: {bug_id['description']}, Severity: {bug_id['severity']}, Status: {bug_id['status']}")
+    #     for bug_id, description, severity, status in zip(self.ids, self.desc, self.sev, self.status):
+    #         print(f"Bug ID: {bug_id}, Description: {description}, Severity: {severity}, Status: {status}")
 
 if __name__ == "__main__":
     tracker = bugtracker()
@@ -1,4 +1,6 @@
 class student:
+    __slots__ = ('name', 'grade', 'department')
+
     def __init__(self,name,grade,department):
         self.name = name
         self.grade = grade
@@ -1,4 +1,11 @@
+import csv
+import sys
+from collections import Counter
+
+
 class TestCase:
+    __slots__ = ('test_id', 'test_name', 'module', 'status')
+
     def __init__(self, test_id, test_name, module, status):
         self.test_id = test_id
         self.test_name = test_name
@@ -8,26 +15,24 @@ class TestCase:
     def execute_test(self, result):
         self.status = result
     
-    def display_test_case(self):
-        print(f"Test ID: {self.test_id}")
-        print(f"Test Name: {self.test_name}")
-        print(f"Module: {self.module}")
-        print(f"Status: {self.status}")
+    def display_text(self):
+        return (f"Test ID: {self.test_id}\n"
+                f"Test Name: {self.test_name}\n"
+                f"Module: {self.module}\n"
+                f"Status: {self.status}\n")
 
-    def to_csv_row(self):
-        return f"{self.test_id},{self.test_name},{self.module},{self.status}"
+    def display_test_case(self):
+        sys.stdout.write(self.display_text())
 
 class AutomatedTestCase(TestCase):
+    __slots__ = ('automation_tool',)
+
     def __init__(self, test_id, test_name, module, status, automation_tool):
         super().__init__(test_id, test_name, module, status)
         self.automation_tool = automation_tool
 
-    def display_test_case(self):
-        super().display_test_case()
-        print(f"Automation Tool: {self.automation_tool}")
-    
-    def to_csv_row(self):
-        return f"{super().to_csv_row()},{self.automation_tool}"
+    def display_text(self):
+        return TestCase.display_text(self) + f"Automation Tool: {self.automation_tool}\n"
 
 class TestSuite:
     def __init__(self, suite_name):
@@ -38,21 +43,32 @@ class TestSuite:
         self.test_cases.append(test_case)
     
     def run_all_tests(self):
-        for testcase in self.test_cases:
-            result = input(f"Enter result for test '{testcase.test_name}' (Pass/Fail): ").strip().lower()
-            testcase.execute_test(result)
+        results = [input(f"Enter result for test '{testcase.test_name}' (Pass/Fail): ")
+                   for testcase in self.test_cases]
+        self.run_all_tests_batch(results)
+
+    def run_all_tests_batch(self, results):
+        if len(results) != len(self.test_cases):
+            raise ValueError(f"Expected {len(self.test_cases)} results, got {len(results)}")
+        statuses = [result.strip().lower() for result in results]
+        for testcase, status in zip(self.test_cases, statuses):
+            testcase.execute_test(status)
 
     def save_results_to_csv(self, filename):
-        with open(filename, 'w') as file:
-            file.write("Test ID,Test Name,Module,Status,Automation Tool\n")
-            for testcase in self.test_cases:
-                file.write(testcase.to_csv_row() + "\n")
+        rows = [[tc.test_id, tc.test_name, tc.module, tc.status, getattr(tc, 'automation_tool', '')]
+                for tc in self.test_cases]
+        with open(filename, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(["Test ID", "Test Name", "Module", "Status", "Automation Tool"])
+            writer.writerows(rows)
 
     def summary_report(self):
-        total = len(self.test_cases)
-        passed = sum(1 for tc in self.test_cases if tc.status.lower() == 'pass')
-        failed = sum(1 for tc in self.test_cases if tc.status.lower() == 'fail')
-        not_executed = sum(1 for tc in self.test_cases if tc.status.lower() not in ['pass', 'fail'])
+        test_cases = self.test_cases
+        total = len(test_cases)
+        counts = Counter(tc.status.lower() for tc in test_cases)
+        passed = counts.get('pass', 0)
+        failed = counts.get('fail', 0)
+        not_executed = total - passed - failed
         
         print(f"Total Tests: {total}")
         print(f"Passed Tests: {passed}")
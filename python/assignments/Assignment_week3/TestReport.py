@@ -2,22 +2,24 @@ import numpy as np
 
 class TestReport:
     def __init__(self, execution_times):
-        self.execution_times = execution_times
+        self.execution_times = np.asarray(execution_times, dtype=np.float32)
         
     def average_time(self):
-        mean = np.mean(self.execution_times)
+        mean = self.execution_times.mean()
         return mean
 
     def max_time(self):
-        maximum = np.max(self.execution_times)
+        maximum = self.execution_times.max()
         return maximum
     
 class RegressionReport(TestReport):
     def __init__(self, execution_times):
         super().__init__(execution_times)
+        self.sorted_times = np.sort(self.execution_times)
         
     def slow_test(self, threshold):
-        slow_tests = self.execution_times[self.execution_times > threshold]
+        start = np.searchsorted(self.sorted_times, threshold, side='right')
+        slow_tests = self.sorted_times[start:]
         return slow_tests
      
 tests = np.array([10, 15, 20, 25, 30, 35, 40, 45])
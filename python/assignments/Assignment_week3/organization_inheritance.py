@@ -1,4 +1,6 @@
 class Employee:
+    __slots__ = ('name', 'emp_id', 'position')
+
     def __init__(self, name, emp_id, position):
         self.name = name
         self.emp_id = emp_id
@@ -8,6 +10,8 @@ class Employee:
         print(f"Name: {self.name}, ID: {self.emp_id}, Position: {self.position}")
 
 class Manager(Employee):
+    __slots__ = ('team_size',)
+
     def __init__(self, name, emp_id, position, team_size):
         super().__init__(name, emp_id, position) # Call base class constructor
         self.team_size = team_size 
@@ -17,6 +21,8 @@ class Manager(Employee):
         print(f"Team Size: {self.team_size}")
 
 class Developer(Employee):
+    __slots__ = ('programming_language',)
+
     def __init__(self, name, emp_id, position, programming_language):
         super().__init__(name, emp_id, position) # Call base class constructor
         self.programming_language = programming_language
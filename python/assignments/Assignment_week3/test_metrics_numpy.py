@@ -2,13 +2,19 @@ import numpy as np
 
 # Create a 5x50 matrix of random execution times
 # 5 test cycles with 50 tests each, values ranging from 5 to 50 milliseconds
-execution_times = np.random.randint(5, 51, size=(5, 50))
+rng = np.random.default_rng(seed=0)
+execution_times = rng.integers(5, 51, size=(5, 50), dtype=np.int32)
 print("Execution Times:\n", execution_times)
 
 # Basic Statistical Analysis
 #--------------------------
+# Row-wise sum and sum of squares, shared by the mean and standard deviation below
+cycle_sums = execution_times.sum(axis=1, dtype=np.float64)
+cycle_sq_sums = np.square(execution_times, dtype=np.float64).sum(axis=1)
+tests_per_cycle = execution_times.shape[1]
+
 # Calculate mean execution time for each cycle (axis=1 means row-wise)
-avg_times = np.mean(execution_times, axis=1)
+avg_times = cycle_sums / tests_per_cycle
 print("\nAverage Execution Times for each cycle:", avg_times)
 
 # Find the maximum execution time across all tests and cycles
@@ -16,7 +22,8 @@ max_times = np.max(execution_times)
 print("Maximum Execution Times:", max_times)
 
 # Calculate standard deviation for each cycle to measure time variability
-standard_devs = np.std(execution_times, axis=1)
+# (population std from E[x^2] - E[x]^2, so no second pass over the matrix)
+standard_devs = np.sqrt(cycle_sq_sums / tests_per_cycle - avg_times * avg_times)
 print("Standard Deviation of Execution Times for each cycle:", standard_devs)
 
 # Array Slicing Examples
@@ -44,11 +51,11 @@ print("Difference between Cycle 2 and 3 times:", execution_times[1] - execution_
 # Mathematical Transformations
 #--------------------------
 # Calculate square root - useful for normalizing skewed distributions
-sqrt = np.sqrt(execution_times)
+sqrt = np.sqrt(execution_times, dtype=np.float32)
 print("\nSquare root of execution times (first row):", sqrt[0][:10])
 
 # Calculate cube - emphasizes differences between values
-cube = np.power(execution_times, 3)
+cube = execution_times * execution_times * execution_times
 print("Cube of execution times (first row):", cube[0][:10])
 
 # Natural logarithm - useful for data with exponential growth patterns
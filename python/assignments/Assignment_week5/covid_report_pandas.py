@@ -1,73 +1,120 @@
-import pandas as pd
+import os
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 class Dataset:
     def __init__(self, filepath):
         self.filepath = filepath
+        self.parquet_path = os.path.splitext(filepath)[0] + '.parquet'
 
+    # Reuse the Parquet copy while it is newer than the CSV, otherwise re-parse and refresh it
     def load_data(self):
-        self.data = pd.read_csv(self.filepath)
+        table = None
+        if os.path.exists(self.parquet_path) and os.path.getmtime(self.parquet_path) >= os.path.getmtime(self.filepath):
+            try:
+                table = pq.read_table(self.parquet_path)
+            except (OSError, pa.ArrowInvalid):
+                table = None
+        if table is None:
+            table = pacsv.read_csv(self.filepath, read_options=pacsv.ReadOptions(use_threads=True))
+            self._write_cache(table)
+        self.data = table.to_pandas()
         return self.data
+
+    # Write the Parquet copy next to the CSV and swap it in, so a partial write is never read back
+    def _write_cache(self, table):
+        tmp_path = self.parquet_path + '.tmp'
+        try:
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, self.parquet_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
     
 class CovidReport(Dataset):
     def __init__(self, filepath):
         super().__init__(filepath)
         self.data = self.load_data()
+        self.data['WHO Region'] = self.data['WHO Region'].astype('category')
+        self._index_data()
+
+    # Rebuild the cached views whenever self.data is replaced
+    def _index_data(self):
+        self._region_gb = self.data.groupby('WHO Region', observed=True)
+        self._sorted_by_confirmed = None
+        self._by_country = None
+
+    # Data sorted by Confirmed Cases, computed once per dataset
+    @property
+    def sorted_by_confirmed(self):
+        if self._sorted_by_confirmed is None:
+            self._sorted_by_confirmed = self.data.sort_values('Confirmed', ascending=False, kind='stable')
+        return self._sorted_by_confirmed
+
+    # Data indexed and sorted by country, computed once per dataset
+    @property
+    def by_country(self):
+        if self._by_country is None:
+            self._by_country = self.data.set_index('Country/Region', drop=False).sort_index()
+        return self._by_country
 
     # Summarize Case Counts by Region
         # Display total confirmed, death, and recovered cases for each region.
     def summarize_cases_by_region(self):
-        summary = self.data.groupby('WHO Region').agg({
-            'Confirmed': 'sum',
-            'Deaths': 'sum',
-            'Recovered': 'sum',
-            'Active': 'sum'
-        }).reset_index()
+        summary = self._region_gb[['Confirmed', 'Deaths', 'Recovered', 'Active']].sum().reset_index()
         return summary
 
     # Filter Low Case Records
         # Exclude entries where confirmed cases are < 10.
     def filter_low_case_records(self):
         self.data = self.data[self.data['Confirmed'] >= 10]
+        self._index_data()
         return self.data
     
     # Identify Region with Highest Confirmed Cases
     def region_with_highest_cases(self):
-        region = self.data.groupby('WHO Region')['Confirmed'].sum().idxmax()
+        region = self._region_gb['Confirmed'].sum().idxmax()
         return region
 
     # Sort data by Confirmed Cases and Save to CSV
     def save_sorted_data(self, output_filepath):
-        sorted_data = self.data.sort_values(by='Confirmed', ascending=False)
-        sorted_data.to_csv(output_filepath, index=False)
+        sorted_data = self.sorted_by_confirmed
+        pacsv.write_csv(pa.Table.from_pandas(sorted_data, preserve_index=False), output_filepath)
         return sorted_data
 
     # Top 5 Countries by Case Count
     def top_5_countries_by_case_count(self):
-        return self.data.sort_values('Confirmed', ascending=False).head(5)[['Country/Region', 'Confirmed', 'Deaths', 'Recovered']]
+        return self.sorted_by_confirmed.head(5)[['Country/Region', 'Confirmed', 'Deaths', 'Recovered']]
 
     # Region with Lowest Death Count
     def region_with_lowest_death_count_cases(self):
-        region = self.data.groupby('WHO Region')['Deaths'].sum().idxmin()
+        region = self._region_gb['Deaths'].sum().idxmin()
         return region
         
     # India Case Summary
     def india_case_summary(self):
-        return self.data[self.data['Country/Region'] == 'India'].to_string(index=False)
+        by_country = self.by_country
+        rows = by_country.loc[['India']] if 'India' in by_country.index else by_country.iloc[:0]
+        return rows.to_string(index=False)
     
     # Mortality Rate by Region
     def mortality_rate_by_region(self):
-        region = self.data.groupby('WHO Region')['Deaths'].sum() / self.data.groupby('WHO Region')['Confirmed'].sum() * 100
+        totals = self._region_gb[['Deaths', 'Confirmed']].sum()
+        region = totals['Deaths'] / totals['Confirmed'] * 100
         return region
     
     # Recovery Rate by Region
     def compare_recovery_rates(self):
-        region = self.data.groupby('WHO Region')['Recovered'].sum() / self.data.groupby('WHO Region')['Confirmed'].sum() * 100
+        totals = self._region_gb[['Recovered', 'Confirmed']].sum()
+        region = totals['Recovered'] / totals['Confirmed'] * 100
         return region
 
     # Detect Outliers in Case Counts
     def detect_outliers(self):
-        mean = self.data['Confirmed'].mean()
-        std_dev = self.data['Confirmed'].std()
+        confirmed = self.data['Confirmed'].to_numpy()
+        mean, std_dev = np.nanmean(confirmed), np.nanstd(confirmed, ddof=1)
 
         threshold_upper = mean + 2 * std_dev
         threshold_lower = mean - 2 * std_dev
@@ -77,7 +124,7 @@ class CovidReport(Dataset):
     
     # Group by Country Counts
     def group_by_country(self):
-        return self.data.groupby('Country/Region').size().reset_index(name='Counts')
+        return self.data['Country/Region'].value_counts(sort=False).sort_index().rename_axis('Country/Region').reset_index(name='Counts')
     
     # Countries with Zero Recovered Cases
     def country_with_zero_recovered_cases(self):
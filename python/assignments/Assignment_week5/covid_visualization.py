@@ -5,7 +5,6 @@ import matplotlib.pyplot as plt
 class covid_visualization(cr.CovidReport):
     def __init__(self, file_path):
         super().__init__(file_path)
-        self.data = self.load_data()
 
     # Bar Chart of Top 5 Countries by Confirmed Cases
     def plot_top_5_countries_by_case_count(self):
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
 
@@ -42,12 +43,9 @@ class CovidEDA:
         # upper_bound = Q3 + 1.5 * IQR
 
     def outlier_detection(self, data):
-        confirmed_q1 = data['Confirmed'].quantile(0.25)
-        confirmed_q3 = data['Confirmed'].quantile(0.75)
+        values = data[['Confirmed', 'New cases']].to_numpy()
+        (confirmed_q1, new_cases_q1), (confirmed_q3, new_cases_q3) = np.nanquantile(values, [0.25, 0.75], axis=0)
         confirmed_iqr = confirmed_q3 - confirmed_q1
-
-        new_cases_q1 = data['New cases'].quantile(0.25)
-        new_cases_q3 = data['New cases'].quantile(0.75)
         new_cases_iqr = new_cases_q3 - new_cases_q1
 
         confirmed_iqr_lower_bound = confirmed_q1 - 1.5 * confirmed_iqr
@@ -65,8 +63,10 @@ class CovidEDA:
         print("Lower Bound:", new_cases_iqr_lower_bound)
         print("Upper Bound:", new_cases_iqr_upper_bound)
 
-        cleaned_data = data[(data['Confirmed'] >= confirmed_iqr_lower_bound) & (data['Confirmed'] <= confirmed_iqr_upper_bound) &
-                            (data['New cases'] >= new_cases_iqr_lower_bound) & (data['New cases'] <= new_cases_iqr_upper_bound)]
+        # Check both columns against their bounds in one broadcast comparison
+        lower_bounds = np.array([confirmed_iqr_lower_bound, new_cases_iqr_lower_bound])
+        upper_bounds = np.array([confirmed_iqr_upper_bound, new_cases_iqr_upper_bound])
+        cleaned_data = data[((values >= lower_bounds) & (values <= upper_bounds)).all(axis=1)]
         
         print("\nCleaned Data for Confirmed and New Cases:")
         print(cleaned_data)
@@ -8,8 +8,8 @@ trained_scaler = scaler.fit_transform(data)
 print("Original Data:\n", data)
 print("Standardized Normal Distribution Data:\n", trained_scaler)
 
-trained_scaler1 = scaler.fit(data)
-print("Trained Scaler - fit:", trained_scaler1)
+# The scaler is already fitted above, so reuse its learned mean/scale instead of refitting
+print("Trained Scaler - mean:", scaler.mean_, "scale:", scaler.scale_)
 
 trained_scaler2 = scaler.transform(data)
 print("Transformed Data:\n", trained_scaler2)
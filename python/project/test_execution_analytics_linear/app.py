@@ -4,7 +4,9 @@ import pandas as pd
 import numpy as np
 import io
 import os
-import pickle
+import joblib
+import matplotlib
+matplotlib.use("Agg")  # render off-screen; st.pyplot only needs the image
 import matplotlib.pyplot as plt
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
@@ -14,19 +16,23 @@ from sklearn.metrics import mean_squared_error, r2_score
 class DatasetLoader:
     def __init__(self, file_path=None, dataframe=None):
         self.data = None
+        self.numeric_cols = []
         if dataframe is not None:
-            self.data = dataframe.copy()
+            self.data = dataframe
         elif file_path:
             try:
                 self.data = pd.read_csv(file_path)
             except Exception as e:
                 st.error(f"Error loading dataset: {e}")
+        if self.data is not None:
+            self.numeric_cols = list(self.data.select_dtypes(include=[np.number]).columns)
 
     def get_data(self):
         return self.data
 
     def set_data(self, data, file_path=None):
-        self.data = data.copy()
+        self.data = data
+        self.numeric_cols = list(self.data.select_dtypes(include=[np.number]).columns)
         if file_path:
             self.data.to_csv(file_path, index=False)
 
@@ -36,14 +42,14 @@ class CleanedData(DatasetLoader):
 
     def fill_missing_values(self, numeric_only=True):
         try:
-            data_cleaned = self.get_data().copy()
+            data = self.get_data()
             if numeric_only:
-                numeric_columns = data_cleaned.select_dtypes(include=[np.number]).columns
+                numeric_columns = self.numeric_cols
             else:
-                numeric_columns = data_cleaned.columns
-            for col in numeric_columns:
-                mean = data_cleaned[col].mean()
-                data_cleaned[col] = data_cleaned[col].fillna(mean)
+                numeric_columns = data.columns
+            # fillna returns a new frame, so the loaded data is left untouched without a full copy
+            means = np.nanmean(data[numeric_columns].to_numpy(dtype=np.float64), axis=0)
+            data_cleaned = data.fillna(pd.Series(means, index=numeric_columns))
             return data_cleaned
         except Exception as e:
             st.error(f"Error filling missing values: {e}")
@@ -51,16 +57,19 @@ class CleanedData(DatasetLoader):
 
     def remove_outliers(self, data_cleaned, columns):
         try:
-            df = data_cleaned.copy()
-            for column in columns:
-                if column not in df.columns:
-                    continue
-                Q1 = df[column].quantile(0.25)
-                Q3 = df[column].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                df = df[(df[column] >= lower_bound) & (df[column] <= upper_bound)]
+            df = data_cleaned
+            columns = [column for column in columns if column in df.columns]
+            if not columns:
+                return df
+            values = df[columns].to_numpy()
+            Q1, Q3 = np.nanpercentile(values, [25, 75], axis=0)
+            IQR = Q3 - Q1
+            lower_bound = Q1 - 1.5 * IQR
+            upper_bound = Q3 + 1.5 * IQR
+            # Keep rows that fall inside the bounds for every column
+            in_bounds = values >= lower_bound
+            in_bounds &= values <= upper_bound
+            df = df[in_bounds.all(axis=1)]
             return df
         except Exception as e:
             st.error(f"Error removing outliers: {e}")
@@ -73,15 +82,67 @@ class DataScaler(CleanedData):
 
     def scale_data(self, data, columns=None):
         try:
-            data_scaled = data.copy()
             if columns is None:
-                columns = data_scaled.select_dtypes(include=['float64', 'int64']).columns
-            data_scaled[columns] = self.scaler.fit_transform(data_scaled[columns])
+                if data is self.data:
+                    columns = self.numeric_cols
+                else:
+                    columns = data.select_dtypes(include=[np.number]).columns
+            # Work on one contiguous array instead of the DataFrame
+            values = data[columns].to_numpy(dtype=np.float64)
+            scaled = self.scaler.fit_transform(values)
+            # assign builds a new frame; only the scaled columns get new buffers
+            data_scaled = data.assign(**dict(zip(columns, scaled.T)))
             return data_scaled
         except Exception as e:
             st.error(f"Error scaling data: {e}")
             return data
 
+# --- Cached pipeline steps (Streamlit reruns the whole script on every interaction) ---
+@st.cache_data(show_spinner=False)
+def load_csv(file_bytes):
+    return pd.read_csv(io.BytesIO(file_bytes), engine="pyarrow")
+
+@st.cache_data(show_spinner=False)
+def clean_data(df, fill_mean, numeric_only, outlier_columns):
+    cd = CleanedData(dataframe=df)
+    if fill_mean:
+        cleaned = cd.fill_missing_values(numeric_only=numeric_only)
+    else:
+        cleaned = cd.get_data()
+    if outlier_columns:
+        cleaned = cd.remove_outliers(cleaned, outlier_columns)
+    return cleaned
+
+@st.cache_data(show_spinner=False)
+def scale_data(df, columns):
+    return DataScaler().scale_data(df, columns=columns)
+
+@st.cache_resource(show_spinner=False)
+def train_model(X_train, y_train):
+    model = LinearRegression()
+    model.fit(X_train, y_train)
+    return model
+
+# --- Plot helpers ---
+MAX_SCATTER_POINTS = 2000
+
+def sample_points(actual, predicted, max_points=MAX_SCATTER_POINTS):
+    # Draw at most max_points markers; the trend is readable from a fixed random subset
+    if len(actual) <= max_points:
+        return actual, predicted
+    idx = np.random.default_rng(0).choice(len(actual), max_points, replace=False)
+    return actual[idx], predicted[idx]
+
+def plot_actual_vs_predicted(ax, actual, predicted, title):
+    xs, ys = sample_points(actual, predicted)
+    ax.scatter(xs, ys, s=5, rasterized=True)
+    # The ideal line only needs its two end points
+    lo, hi = actual.min(), actual.max()
+    ax.plot([lo, hi], [lo, hi], linestyle="--")
+    ax.set_title(title)
+    ax.set_xlabel("Actual")
+    ax.set_ylabel("Predicted")
+
 # --- Streamlit UI ---
 st.set_page_config(page_title="Linear Regression Model", layout="wide")
 # Main title with icon and themed color
@@ -94,7 +155,7 @@ upload = st.sidebar.file_uploader("Upload CSV file", type=["csv"])
 if upload is not None:
     # Read uploaded file into dataframe
     try:
-        df_initial = pd.read_csv(upload)
+        df_initial = load_csv(upload.getvalue())
     except Exception as e:
         st.sidebar.error(f"Upload error: {e}")
         df_initial = None
@@ -127,18 +188,12 @@ with left:
 
         # Outlier removal options
         st.markdown("**Outlier removal (IQR)**")
-        numeric_cols = list(df.select_dtypes(include=[np.number]).columns)
+        numeric_cols = loader.numeric_cols
         outlier_columns = st.multiselect("Choose numeric columns to remove outliers from", numeric_cols, default=numeric_cols[:3])
         run_clean = st.button("Run cleaning")
 
         if run_clean:
-            cd = CleanedData(dataframe=df)
-            if fill_mean:
-                cleaned = cd.fill_missing_values(numeric_only=numeric_only)
-            else:
-                cleaned = cd.get_data().copy()
-            if outlier_columns:
-                cleaned = cd.remove_outliers(cleaned, outlier_columns)
+            cleaned = clean_data(df, fill_mean, numeric_only, outlier_columns)
 
             st.success("Cleaning completed.")
             # smaller subheader for cleaned data preview
@@ -147,6 +202,7 @@ with left:
 
             # Allow saving cleaned CSV to session state
             st.session_state["cleaned_df"] = cleaned
+            st.session_state["numeric_cols"] = list(cleaned.select_dtypes(include=[np.number]).columns)
 
             # Download cleaned CSV
             towrite = io.StringIO()
@@ -165,12 +221,11 @@ with middle:
     if cleaned_df is not None:
         # smaller subheader for scaling section
         st.markdown("<h4 style='font-size:14px;margin:4px 0 6px 0;'>Scaling</h4>", unsafe_allow_html=True)
-        numeric_cols = list(cleaned_df.select_dtypes(include=[np.number]).columns)
+        numeric_cols = st.session_state.get("numeric_cols", [])
         chosen_cols = st.multiselect("Columns to scale (numeric)", numeric_cols, default=numeric_cols)
         scale_button = st.button("Scale selected columns")
         if scale_button:
-            scaler = DataScaler(dataframe=cleaned_df)
-            scaled_df = scaler.scale_data(cleaned_df, columns=chosen_cols)
+            scaled_df = scale_data(cleaned_df, chosen_cols)
             st.success("Scaling completed.")
             st.session_state["scaled_df"] = scaled_df
             st.dataframe(scaled_df.head(8))
@@ -252,23 +307,22 @@ with middle:
                 ]
                 
                 # Features from scaled data, targets from cleaned data (to match linear_regression_model.py)
-                X = scaled_df[default_features].values  # Use exact same features
+                X = scaled_df[default_features].to_numpy(dtype=np.float32)  # Use exact same features
                 # Use cleaned data for targets
-                y_time = cleaned_df['Estimated_Execution_Time'].values
-                y_defects = cleaned_df['Expected_Defect_Count'].values
-
-                # Use exact same split parameters
-                X_train, X_test, y_train_time, y_test_time = train_test_split(X, y_time, test_size=0.2, random_state=42)
-                _, _, y_train_defects, y_test_defects = train_test_split(X, y_defects, test_size=0.2, random_state=42)
+                y_time = cleaned_df['Estimated_Execution_Time'].to_numpy(dtype=np.float32)
+                y_defects = cleaned_df['Expected_Defect_Count'].to_numpy(dtype=np.float32)
 
-                time_model = LinearRegression()
-                time_model.fit(X_train, y_train_time)
+                # Use exact same split parameters; split row indices once and reuse them for both targets
+                train_idx, test_idx = train_test_split(np.arange(len(X)), test_size=0.2, random_state=42)
+                X_train, X_test = X[train_idx], X[test_idx]
+                y_train_time, y_test_time = y_time[train_idx], y_time[test_idx]
+                y_train_defects, y_test_defects = y_defects[train_idx], y_defects[test_idx]
 
-                defect_model = LinearRegression()
-                defect_model.fit(X_train, y_train_defects)
+                # Fit both targets in one multi-output solve (column 0: execution time, column 1: defect count)
+                model = train_model(X_train, np.column_stack([y_train_time, y_train_defects]))
 
-                y_pred_time = time_model.predict(X_test)
-                y_pred_defects = defect_model.predict(X_test)
+                y_pred = model.predict(X_test)
+                y_pred_time, y_pred_defects = y_pred[:, 0], y_pred[:, 1]
 
                 # Metrics
                 mse_time = mean_squared_error(y_test_time, y_pred_time)
@@ -277,7 +331,7 @@ with middle:
                 mse_def = mean_squared_error(y_test_defects, y_pred_defects)
                 r2_def = r2_score(y_test_defects, y_pred_defects)
 
-                st.session_state["models"] = {"time_model": time_model, "defect_model": defect_model}
+                st.session_state["model"] = model
                 st.session_state["last_eval"] = {
                     "y_test_time": y_test_time, "y_pred_time": y_pred_time,
                     "y_test_defects": y_test_defects, "y_pred_defects": y_pred_defects,
@@ -306,33 +360,19 @@ with right:
         # Prediction plots header: match Train Linear Models style
         st.markdown("<h3 style='font-size:20px;color:#0f4c81;margin:0;'>Prediction plots</h3>", unsafe_allow_html=True)
         fig, axes = plt.subplots(1, 2, figsize=(10, 4))
-        axes[0].scatter(eval_info["y_test_time"], eval_info["y_pred_time"])
-        axes[0].plot(eval_info["y_test_time"], eval_info["y_test_time"], linestyle="--")
-        axes[0].set_title("Execution Time: actual vs predicted")
-        axes[0].set_xlabel("Actual")
-        axes[0].set_ylabel("Predicted")
-
-        axes[1].scatter(eval_info["y_test_defects"], eval_info["y_pred_defects"])
-        axes[1].plot(eval_info["y_test_defects"], eval_info["y_test_defects"], linestyle="--")
-        axes[1].set_title("Defects: actual vs predicted")
-        axes[1].set_xlabel("Actual")
-        axes[1].set_ylabel("Predicted")
+        plot_actual_vs_predicted(axes[0], eval_info["y_test_time"], eval_info["y_pred_time"], "Execution Time: actual vs predicted")
+        plot_actual_vs_predicted(axes[1], eval_info["y_test_defects"], eval_info["y_pred_defects"], "Defects: actual vs predicted")
 
         st.pyplot(fig)
+        plt.close(fig)
 
         # Download models header: match Train Linear Models style
         st.markdown("<h3 style='font-size:20px;color:#0f4c81;margin:0;'>Download Models</h3>", unsafe_allow_html=True)
-        models = st.session_state.get("models")
-        if models:
-            # time model
-            time_bytes = io.BytesIO()
-            pickle.dump(models["time_model"], time_bytes)
-            time_bytes.seek(0)
-            st.download_button("Download time model (.pkl)", data=time_bytes, file_name="time_model.pkl", mime="application/octet-stream")
-
-            def_bytes = io.BytesIO()
-            pickle.dump(models["defect_model"], def_bytes)
-            def_bytes.seek(0)
-            st.download_button("Download defect model (.pkl)", data=def_bytes, file_name="defect_model.pkl", mime="application/octet-stream")
+        model = st.session_state.get("model")
+        if model is not None:
+            # single multi-output model: predict()[:, 0] is execution time, predict()[:, 1] is defect count
+            model_bytes = io.BytesIO()
+            joblib.dump(model, model_bytes, compress=3)
+            st.download_button("Download time & defect model (.joblib)", data=model_bytes.getvalue(), file_name="time_defect_model.joblib", mime="application/octet-stream")
     else:
         st.info("Train models to see evaluation and download options.")
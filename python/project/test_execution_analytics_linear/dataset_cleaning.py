@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 from dataset_rw import DatasetLoader
 
 class CleanedData(DatasetLoader):
@@ -10,11 +11,10 @@ class CleanedData(DatasetLoader):
     def fill_missing_values(self):
         try:
             data = self.get_data()
-            data_cleaned = data.copy()
-            numeric_columns = data_cleaned.select_dtypes(include=[np.number]).columns
-            for col in numeric_columns:
-                mean = data_cleaned[col].mean()
-                data_cleaned[col] = data_cleaned[col].fillna(mean)
+            numeric_columns = self.numeric_cols
+            # fillna returns a new frame, so the loaded data is left untouched without a full copy
+            means = np.nanmean(data[numeric_columns].to_numpy(dtype=np.float64), axis=0)
+            data_cleaned = data.fillna(pd.Series(means, index=numeric_columns))
 
         except Exception as e:
             print("Error filling missing values:", e)
@@ -24,16 +24,17 @@ class CleanedData(DatasetLoader):
     # Remove outliers using IQR method
     def remove_outliers(self, data_cleaned, columns):
         try:
-            data_outliers_removed = data_cleaned.copy()
-            for column in columns:
-                Q1 = data_outliers_removed[column].quantile(0.25)
-                Q3 = data_outliers_removed[column].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-
-                outliers = data_outliers_removed[(data_outliers_removed[column] < lower_bound) | (data_outliers_removed[column] > upper_bound)]
-                data_outliers_removed.drop(outliers.index, inplace=True)
+            data_outliers_removed = data_cleaned
+            values = data_outliers_removed[columns].to_numpy()
+            Q1, Q3 = np.nanpercentile(values, [25, 75], axis=0)
+            IQR = Q3 - Q1
+            lower_bound = Q1 - 1.5 * IQR
+            upper_bound = Q3 + 1.5 * IQR
+
+            # Keep rows that fall inside the bounds for every column
+            in_bounds = values >= lower_bound
+            in_bounds &= values <= upper_bound
+            data_outliers_removed = data_outliers_removed[in_bounds.all(axis=1)]
 
         except Exception as e:
             print("Error removing outliers:", e)
@@ -1,9 +1,11 @@
+import numpy as np
 import pandas as pd
 
 class DatasetLoader:
     def __init__(self, file_path):
         try:
             self.data = pd.read_csv(file_path)
+            self.numeric_cols = list(self.data.select_dtypes(include=[np.number]).columns)
         except Exception as e:
             print("Error loading dataset:", e)
 
@@ -12,4 +14,5 @@ class DatasetLoader:
 
     def set_data(self, data, file_path):
         self.data = data
+        self.numeric_cols = list(self.data.select_dtypes(include=[np.number]).columns)
         self.data.to_csv(file_path, index=False)
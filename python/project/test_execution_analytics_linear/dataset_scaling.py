@@ -1,4 +1,5 @@
 import os
+import numpy as np
 from dotenv import load_dotenv
 from dataset_cleaning import CleanedData
 from sklearn.preprocessing import StandardScaler
@@ -13,9 +14,15 @@ class DataScaler(CleanedData):
 
     def scale_data(self, data):
        try:
-           data_scaled = data.copy()
-           columns = data_scaled.select_dtypes(include=['float64', 'int64']).columns
-           data_scaled[columns] = self.scaler.fit_transform(data_scaled[columns])
+           if data is self.data:
+               columns = self.numeric_cols
+           else:
+               columns = data.select_dtypes(include=[np.number]).columns
+           # Work on one contiguous array instead of the DataFrame
+           values = data[columns].to_numpy(dtype=np.float64)
+           scaled = self.scaler.fit_transform(values)
+           # assign builds a new frame; only the scaled columns get new buffers
+           data_scaled = data.assign(**dict(zip(columns, scaled.T)))
        except Exception as e:
            print("Error scaling data:", e)
 
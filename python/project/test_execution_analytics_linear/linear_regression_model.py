@@ -1,9 +1,9 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import os
 from dotenv import load_dotenv
 from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
 
 # Load environment variables
@@ -27,31 +27,38 @@ FEATURE_COLUMNS = [
 TARGET_TIME = 'Estimated_Execution_Time'
 TARGET_DEFECTS = 'Expected_Defect_Count'
 
-df = pd.read_csv(SCALED_CSV)
-df_raw = pd.read_csv(CLEANED_CSV)
+df = pd.read_csv(SCALED_CSV, engine="pyarrow")
+df_raw = pd.read_csv(CLEANED_CSV, engine="pyarrow")
 
 X = df[FEATURE_COLUMNS].values
 y_time = df_raw[TARGET_TIME].values
 y_defects = df_raw[TARGET_DEFECTS].values
 
-X_train, X_test, y_train_time, y_test_time = train_test_split(X, y_time, test_size=TEST_SIZE, random_state=RANDOM_STATE)
-X_train, X_test, y_train_defects, y_test_defects = train_test_split(X, y_defects, test_size=TEST_SIZE, random_state=RANDOM_STATE)   
-
-time_model = LinearRegression()
-time_model.fit(X_train, y_train_time)
-
-defect_model = LinearRegression()
-defect_model.fit(X_train, y_train_defects)
-
-y_pred_time = time_model.predict(X_test)
-y_pred_defects = defect_model.predict(X_test)
-
-print(X_test)
-print(y_pred_time)
-print(y_pred_defects)
-
-print("Execution Time Model Coefficients:", time_model.coef_)
-print("Execution Time Model Intercept:", time_model.intercept_)
+# Split once with both targets stacked, so features and targets stay aligned by construction
+y_stack = np.column_stack([y_time, y_defects])
+X_train, X_test, y_train, y_test = train_test_split(X, y_stack, test_size=TEST_SIZE, random_state=RANDOM_STATE)
+y_train_time, y_train_defects = y_train.T
+y_test_time, y_test_defects = y_test.T
+
+# Fit both targets in one least-squares solve (column 0: execution time, column 1: defect count).
+# A trailing column of ones gives the intercept, so coef has one row per feature plus the intercept row.
+X_train_b = np.hstack([X_train, np.ones((len(X_train), 1), X_train.dtype)])
+X_test_b = np.hstack([X_test, np.ones((len(X_test), 1), X_test.dtype)])
+coef, *_ = np.linalg.lstsq(X_train_b, y_train, rcond=None)
+
+y_pred = X_test_b @ coef
+y_pred_time, y_pred_defects = y_pred[:, 0], y_pred[:, 1]
+
+print("X_test shape:", X_test.shape)
+print("y_pred_time[:5]:", y_pred_time[:5])
+print("y_pred_defects[:5]:", y_pred_defects[:5])
+if os.getenv("DEBUG"):
+    print(X_test)
+    print(y_pred_time)
+    print(y_pred_defects)
+
+print("Execution Time Model Coefficients:", coef[:-1, 0])
+print("Execution Time Model Intercept:", coef[-1, 0])
 
 
 print("Execution Time Model Evaluation:")